@@ -1,24 +1,107 @@
 import os
 import math
 import json
-import random
+import zlib
+import hashlib
+import struct
 import shutil
+import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # orjson is not bundled with Blender, fall back to the standard json module
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is not bundled with Blender, camera positions are then converted with NumPy
+    njit = None
+
+
+# Cycles compute backends in order of preference, OptiX uses the RT cores of RTX cards
+COMPUTE_DEVICE_TYPES = ('OPTIX', 'CUDA', 'HIP', 'ONEAPI')
+
+# From this many frames on, camera positions are converted with the numba kernel (if installed).
+# For smaller datasets the one-time JIT compilation costs more than it saves
+NUMBA_MIN_FRAMES = 100_000
+
+# Rotation value stored with every frame in the transforms json files
+ROTATION_VALUE = math.radians(360 / 200)
+
+# Script run by each background Blender process started from render_all_multi_gpu
+SHARD_SCRIPT = """import sys
+import bpy
+sys.path.append({module_dir!r})
+from {module_name} import render_shard
+render_shard(bpy, {shard_path!r})
+"""
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _spherical_to_cartesian_kernel(theta, phi, distance, focus_x, focus_y, focus_z, out):
+        # Fuses the trig, multiplications and additions of all three coordinates into one pass
+        for i in prange(theta.shape[0]):
+            sin_phi = math.sin(phi[i])
+            cos_phi = math.cos(phi[i])
+            out[i, 0] = distance * sin_phi * math.cos(theta[i]) + focus_x
+            out[i, 1] = distance * sin_phi * math.sin(theta[i]) + focus_y
+            out[i, 2] = distance * cos_phi + focus_z
+
+
+def spherical_to_cartesian(theta, phi, distance, focus):
+    """
+    Converts spherical coordinates around a focus point to cartesian camera positions.
+
+    Parameters:
+    theta: Horizontal angles in radians.
+    phi: Vertical angles in radians, measured from the z axis.
+    distance: The distance of every position from the focus point.
+    focus: The (x, y, z) coordinates of the focus point.
+
+    Returns:
+    An (N, 3) float32 array of positions.
+    """
+    focus_x, focus_y, focus_z = focus
+
+    if njit is not None and len(theta) >= NUMBA_MIN_FRAMES:
+        positions = np.empty((len(theta), 3), dtype=np.float32)
+        _spherical_to_cartesian_kernel(theta, phi, float(distance), float(focus_x), float(focus_y), float(focus_z), positions)
+        return positions
+
+    sin_phi = np.sin(phi)
+    return np.stack((
+        distance * sin_phi * np.cos(theta) + focus_x,
+        distance * sin_phi * np.sin(theta) + focus_y,
+        distance * np.cos(phi) + focus_z,
+    ), axis=1).astype(np.float32)
 
 
 def point_camera_at(camera, target):
-    # Compute the direction vector from camera to target
-    direction = target.location - camera.location
+    point_camera_at_location(camera, target.location)
+
+
+def point_camera_at_location(camera, target_location):
+    # Compute the direction vector from camera to the target location (a mathutils.Vector)
+    direction = target_location - camera.location
     
     # Create a rotation that points the camera's -Z axis along the direction vector
     # and keeps the Y axis pointing upwards to avoid roll
     rot_quat = direction.to_track_quat('-Z', 'Y')
     
+    # Assign the quaternion directly, which avoids converting it to euler angles and back.
+    # The exporter sets the mode once, so this only changes cameras set up elsewhere
+    if camera.rotation_mode != 'QUATERNION':
+        camera.rotation_mode = 'QUATERNION'
+
     # Apply the rotation to the camera
-    camera.rotation_euler = rot_quat.to_euler()
-    
-    # Ensure the rotation mode is set to 'XYZ' (default)
-    camera.rotation_mode = 'XYZ'
+    camera.rotation_quaternion = rot_quat
 
 
 # Function to get the camera's transformation (view) matrix
@@ -26,13 +109,177 @@ def get_camera_transform_matrix(_scene):
     _camera = _scene.camera
     # Get the 4x4 transformation matrix (world to camera space)
     M = _camera.matrix_local
-    return [list(row) for row in M]  # Convert to list of lists for easier handling
+    return np.asarray(M).tolist()  # Convert to list of lists for easier handling
+
+
+def _json_default(obj):
+    # Lets the standard json module serialize NumPy arrays and scalars
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(file_path, data):
+    """
+    Writes data to a json file. NumPy arrays in the data are serialized directly.
+    Uses orjson if it is installed, otherwise the standard json module.
+    """
+    if orjson is not None:
+        Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, "w") as f:
+            json.dump(data, f, indent=4, default=_json_default)
+
+
+def _png_chunk(chunk_type, chunk_data):
+    # length, type, data and the CRC over type and data
+    crc = zlib.crc32(chunk_type + chunk_data) & 0xFFFFFFFF
+    return struct.pack(">I", len(chunk_data)) + chunk_type + chunk_data + struct.pack(">I", crc)
+
+
+def recompress_png(file_path, level=1):
+    """
+    Recompresses the image data of a PNG file in place with the given zlib level.
+    Only the IDAT stream is touched, so pixels, bit depth and all other chunks stay as they are.
+    Frames are rendered uncompressed and recompressed with this on background threads,
+    which keeps the compression off the render loop (zlib releases the GIL).
+
+    Parameters:
+    file_path: Path to the PNG file.
+    level: zlib compression level, 0 (none) to 9 (smallest). Defaults to 1, about what
+           Blender's previous 15% PNG compression setting used.
+    """
+    png = Path(file_path).read_bytes()
+    signature, position = png[:8], 8
+
+    chunks = []
+    image_data = []
+    while position < len(png):
+        (length,) = struct.unpack(">I", png[position:position + 4])
+        chunk_type = png[position + 4:position + 8]
+        chunk_data = png[position + 8:position + 8 + length]
+        position += 12 + length
+        if chunk_type == b"IDAT":
+            image_data.append(chunk_data)
+            # The recompressed stream is written in place of the first IDAT chunk
+            if len(image_data) > 1:
+                continue
+        chunks.append((chunk_type, chunk_data))
+
+    compressed = zlib.compress(zlib.decompress(b"".join(image_data)), level)
+
+    temp_path = Path(f"{file_path}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(signature)
+        for chunk_type, chunk_data in chunks:
+            f.write(_png_chunk(chunk_type, compressed if chunk_type == b"IDAT" else chunk_data))
+    os.replace(temp_path, file_path)
+
+
+def get_compute_devices(preferences, device_type):
+    """
+    Returns the devices of the given backend that exist on this machine, in the order Cycles
+    lists them. preferences.devices also keeps stale entries of every backend that was ever
+    enumerated, so it can't be used for this.
+    """
+    # get_devices_for_type re-enumerates the backend and appends the CPU, which is left out here
+    return [device for device in preferences.get_devices_for_type(device_type) if device.type == device_type]
+
+
+def select_compute_device_type(preferences):
+    """
+    Sets the first backend of COMPUTE_DEVICE_TYPES that this Blender build supports and that
+    has a device on this machine as the Cycles compute device type.
+
+    Parameters:
+    preferences: The preferences of the Cycles addon.
+
+    Returns:
+    The selected device type, or None if no GPU backend is available.
+    """
+    for device_type in COMPUTE_DEVICE_TYPES:
+        try:
+            preferences.compute_device_type = device_type
+        except TypeError:
+            # Backend is not compiled into this Blender build
+            continue
+        if get_compute_devices(preferences, device_type):
+            return device_type
+    return None
+
+
+def render_shard(bpy, shard_path):
+    """
+    Renders one shard of frames written by NerfSyntheticDatasetExporter.render_all_multi_gpu.
+    Runs inside a background Blender process that has the saved copy of the scene loaded,
+    so all render settings are already in place. Only the GPU assigned to the shard is enabled.
+
+    Parameters:
+    bpy: The Blender Python API module.
+    shard_path: Path to the shard json file describing the frames to render.
+    """
+    with open(shard_path, "r") as f:
+        shard = json.load(f)
+
+    # Enable only the GPU assigned to this shard
+    preferences = bpy.context.preferences.addons['cycles'].preferences
+    device_type = select_compute_device_type(preferences)
+    if device_type is None:
+        raise RuntimeError("No supported GPU found for rendering the shard.")
+    gpus = get_compute_devices(preferences, device_type)
+    gpu_id = shard["gpu_id"]
+    if not 0 <= gpu_id < len(gpus):
+        raise RuntimeError(f"GPU {gpu_id} does not exist, found {len(gpus)} {device_type} device(s) (GPU 0 to {len(gpus) - 1}).")
+    for device in preferences.devices:
+        device.use = False
+    gpus[gpu_id].use = True
+
+    scene = bpy.context.scene
+    scene.cycles.device = 'GPU'
+    camera = scene.camera
+    # The same cached focus location the camera positions were sampled around
+    from mathutils import Vector
+    focus_location = Vector(shard["focus_location"])
+
+    transforms = []
+    compressor = ThreadPoolExecutor()
+    compressions = []
+    for entry in shard["frames"]:
+        camera.location = entry["location"]
+        point_camera_at_location(camera, focus_location)
+
+        # Frames left from a previous run with the same settings are kept
+        if not (shard["frames_reusable"] and os.path.exists(entry["image_path"])):
+            scene.render.filepath = entry["image_path"]
+            bpy.ops.render.render(write_still=True)
+            compressions.append(compressor.submit(recompress_png, entry["image_path"], shard["png_compression_level"]))
+        else:
+            # Without a render the camera matrix has to be updated explicitly
+            bpy.context.view_layer.update()
+
+        transforms.append({
+            "index": entry["index"],
+            "transform_matrix": get_camera_transform_matrix(scene)
+        })
+
+    compressor.shutdown(wait=True)
+    for compression in compressions:
+        compression.result()  # Raise errors from the background threads
+
+    write_json(shard["output_path"], transforms)
 
 
 class NerfSyntheticDatasetExporter:
 
-    def __init__(self, bpy, export_path: Path, focus_point, distance, dataset_sizes=None):
-        self.set_and_create_export_path(export_path=export_path)
+    # Cycles samples and output resolution of the rendered frames
+    RENDER_SAMPLES = 32  # Low since frames are denoised and adaptively sampled
+    RENDER_RESOLUTION = (960, 540)
+    # zlib level the frames are recompressed with. Higher levels cost several times more CPU
+    # time per frame and can leave the background compression running long after the renders
+    PNG_COMPRESSION_LEVEL = 1
+
+    def __init__(self, bpy, export_path: Path, focus_point, distance, dataset_sizes=None, seed: int = 0,
+                 reuse_existing_frames=False):
         if not dataset_sizes:
             dataset_sizes = {
                 "train": 100,
@@ -44,31 +291,69 @@ class NerfSyntheticDatasetExporter:
         self.context = bpy.context
         self.data = bpy.data
         self.ops = bpy.ops
+
+        # Identifies the scene the frames are rendered from. Read before the exporter adds its
+        # camera, which marks the file as modified. Unsaved scenes can't be identified
+        self.reuse_existing_frames = reuse_existing_frames
+        self._scene_file = self.data.filepath
+        self._scene_saved = bool(self._scene_file) and not self.data.is_dirty
+        self._scene_mtime = os.path.getmtime(self._scene_file) if self._scene_saved else None
         
         self.focus_point = focus_point
+        # Detached copy of the focus point's location, so the frame loop doesn't
+        # read it through the Blender API for every frame
+        self._focus_location = focus_point.location.copy()
         self.distance_from_focus = distance
 
+        # Seeded generator, so the same settings always produce the same camera positions
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
         # Initialize the camera object
         camera_data = self.data.cameras.new("Camera")
         self.camera = self.data.objects.new("Camera", camera_data)
         self.scene.collection.objects.link(self.camera)
         self.context.scene.camera = self.camera
+        # point_camera_at assigns quaternions, so the mode only has to be set once
+        self.camera.rotation_mode = 'QUATERNION'
 
         print(f"Initialized scene: {self.scene}; type <{type(self.scene)}>")
 
         # Initialize the camera positions list
         self.randomize_camera_locations()
 
+        # Needs the camera positions to decide whether existing frames can be kept
+        self.set_and_create_export_path(export_path=export_path)
+
         self.log_str = ""
 
+        # Render settings and devices are configured once, on the first render
+        self._render_configured = False
+
     def set_and_create_export_path(self, export_path):
         self.export_path = export_path
         print(f"Set export path: {self.export_path}")
         train_dir = self.export_path / "train"
         val_dir = self.export_path / "val"
         test_dir = self.export_path / "test"
+        manifest_path = self.export_path / "manifest.json"
+        manifest = self.export_manifest()
+
+        # Frames of a previous export can be reused if it was rendered from the same saved scene
+        # with the same settings. The manifest is only written once all its frames are finished
+        self._frames_reusable = False
+        if self.reuse_existing_frames and not self._scene_saved:
+            print("Scene is not saved or has unsaved changes, not reusing existing frames.")
+        elif self.reuse_existing_frames and os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r") as f:
+                    self._frames_reusable = json.load(f) == manifest
+            except ValueError:
+                print(f"Could not read manifest: {manifest_path}")
         
-        if os.path.exists(export_path):
+        if self._frames_reusable:
+            print(f"Existing export matches the manifest, keeping rendered frames: {export_path}")
+        elif os.path.exists(export_path):
             # delete existing directory
             shutil.rmtree(export_path)
             print(f"Deleted existing export path: {export_path}")
@@ -80,6 +365,24 @@ class NerfSyntheticDatasetExporter:
         os.makedirs(val_dir, exist_ok=True)
         print("Export directory created.")
 
+    def export_manifest(self):
+        """
+        Returns everything the rendered frames depend on. It is stored as manifest.json in the
+        export path after all frames are rendered, and frames are only reused if the manifest of
+        a later export matches it.
+        """
+        return {
+            "scene_file": self._scene_file,
+            "scene_mtime": self._scene_mtime,
+            "dataset_sizes": dict(self.dataset_sizes),
+            "distance": self.distance_from_focus,
+            "focus_point": list(self._focus_location),
+            "samples": self.RENDER_SAMPLES,
+            "resolution": list(self.RENDER_RESOLUTION),
+            "seed": self.seed,
+            "camera_positions": hashlib.sha256(self.camera_positions.tobytes()).hexdigest()
+        }
+
     def randomize_camera_locations(self):
         """
         Randomizes camera positions around a focus_point object in spherical coordinates, 
@@ -91,28 +394,16 @@ class NerfSyntheticDatasetExporter:
         distance: The fixed distance from the camera to the focus point (default is 7 units).
         """
 
-        # Extract the focus point's coordinates
-        focus_x, focus_y, focus_z = self.focus_point.location
-
-        # Clear the camera positions list
-        self.camera_positions = []
-
         total_number_of_frames = sum(self.dataset_sizes.values())
 
-        for _ in range(total_number_of_frames):
-            # Randomize the spherical coordinates for the camera
-            # theta is the horizontal angle (0 to 360 degrees)
-            # phi is the vertical angle (20 to 160 degrees, to avoid extreme top or bottom views)
-            theta = random.uniform(0, 2 * math.pi)  # Random angle around the focus point (horizontal)
-            phi = random.uniform(math.radians(20), math.radians(160))  # Random angle for elevation
-
-            # Convert spherical coordinates to cartesian (x, y, z)
-            camera_x = self.distance_from_focus * math.sin(phi) * math.cos(theta) + focus_x
-            camera_y = self.distance_from_focus * math.sin(phi) * math.sin(theta) + focus_y
-            camera_z = self.distance_from_focus * math.cos(phi) + focus_z
+        # Randomize the spherical coordinates for all cameras at once
+        # theta is the horizontal angle (0 to 360 degrees)
+        # phi is the vertical angle (20 to 160 degrees, to avoid extreme top or bottom views)
+        theta = self.rng.uniform(0, 2 * np.pi, total_number_of_frames)  # Random angles around the focus point (horizontal)
+        phi = self.rng.uniform(np.radians(20), np.radians(160), total_number_of_frames)  # Random angles for elevation
 
-            # Append the new camera position relative to the focus point
-            self.camera_positions.append((camera_x, camera_y, camera_z))
+        # Convert spherical coordinates to cartesian (x, y, z) relative to the focus point
+        self.camera_positions = spherical_to_cartesian(theta, phi, self.distance_from_focus, self._focus_location)
 
     def prepare_frame(self, frame_number):
         """
@@ -123,17 +414,16 @@ class NerfSyntheticDatasetExporter:
         focus_point: The object to look at (e.g., a Blender object).
         """
         # Load and set camera position
-        camera_x, camera_y, camera_z = self.camera_positions[frame_number]
-        self.camera.location = (camera_x, camera_y, camera_z)
+        self.camera.location = self.camera_positions[frame_number]
         
         # Point the camera at the focus point
-        point_camera_at(self.camera, self.focus_point)
+        point_camera_at_location(self.camera, self._focus_location)
 
     @property
     def current_camera_transform_matrix(self):
         # Get the 4x4 transformation matrix (world to camera space)
         M = self.scene.camera.matrix_local
-        return [list(row) for row in M] 
+        return np.asarray(M, dtype=np.float64)
 
     def print_info(self, message):
         self.ops.wm.report({'INFO'}, message)
@@ -159,29 +449,7 @@ class NerfSyntheticDatasetExporter:
         Use this to test rendering a single frame to ensure the output is as desired.
         """
 
-        # Set the rendering engine to Cycles
-        self.context.scene.render.engine = 'CYCLES'
-
-        # Enable GPU rendering for the scene in Cycles settings
-        self.context.scene.cycles.device = 'GPU'
-
-        # Optional: Configure the number of samples for rendering (affects render quality)
-        self.context.scene.cycles.samples = 128  # Adjust sample size
-
-        preferences = self.context.preferences.addons['cycles'].preferences
-        preferences.compute_device_type = 'CUDA'  # For NVIDIA, change to 'OPENCL' for AMD
-        preferences.get_devices()  # Make sure devices are detected
-
-        # Set the active GPU device
-        self.context.scene.cycles.device = 'GPU'
-
-        self.context.scene.render.image_settings.file_format = 'PNG'
-        self.context.scene.render.resolution_x = 960
-        self.context.scene.render.resolution_y = 540
-        self.context.scene.render.image_settings.color_mode = 'RGB'
-        self.context.scene.render.image_settings.color_depth = '16'
-        self.context.scene.render.image_settings.compression = 15
-        self.context.scene.render.image_settings.color_depth = '16'
+        self._configure_render()
 
         def render_image(filepath):
             self.log(f"Rendering image to: {filepath}")  # Debugging
@@ -192,8 +460,9 @@ class NerfSyntheticDatasetExporter:
         # Render all frames for each dataset type
         self.prepare_frame(0)
         image_path = self.export_path / "test.png"
-        # Render the image
+        # Render the image, frames are written uncompressed so compress it afterwards
         render_image(image_path)
+        recompress_png(image_path, self.PNG_COMPRESSION_LEVEL)
         
     def render_all(self):
         """
@@ -201,29 +470,8 @@ class NerfSyntheticDatasetExporter:
         Also saves the camera positions as json files.
         """
 
-        # Set the rendering engine to Cycles
-        self.context.scene.render.engine = 'CYCLES'
-
-        # Enable GPU rendering for the scene in Cycles settings
-        self.context.scene.cycles.device = 'GPU'
-
-        # Optional: Configure the number of samples for rendering (affects render quality)
-        self.context.scene.cycles.samples = 128  # Adjust sample size
-
-        preferences = self.context.preferences.addons['cycles'].preferences
-        preferences.compute_device_type = 'CUDA'  # For NVIDIA, change to 'OPENCL' for AMD
-        preferences.get_devices()  # Make sure devices are detected
-
-        # Set the active GPU device
-        self.context.scene.cycles.device = 'GPU'
-
-        self.context.scene.render.image_settings.file_format = 'PNG'
-        self.context.scene.render.resolution_x = 960
-        self.context.scene.render.resolution_y = 540
-        self.context.scene.render.image_settings.color_mode = 'RGB'
-        self.context.scene.render.image_settings.color_depth = '16'
-        self.context.scene.render.image_settings.compression = 15
-        self.context.scene.render.image_settings.color_depth = '16'
+        self._configure_render()
+        self._invalidate_manifest()
 
         def render_image(filepath):
             self.log(f"Rendering image to: {filepath}")  # Debugging
@@ -231,20 +479,12 @@ class NerfSyntheticDatasetExporter:
             self.ops.render.render(write_still=True)
 
         # Dictionaries to store the camera transforms for each set
-        transforms_dicts = {
-            "train": {
-                "camera_angle_x": self.scene.camera.data.angle_x,
-                "frames": []
-            },
-            "val": {
-                "camera_angle_x": self.scene.camera.data.angle_x,
-                "frames": []
-            },
-            "test": {
-                "camera_angle_x": self.scene.camera.data.angle_x,
-                "frames": []
-            }
-        }
+        transforms_dicts = self._empty_transforms_dicts()
+
+        # Frames are written uncompressed and compressed on background threads
+        # while the next frames render
+        compressor = ThreadPoolExecutor()
+        compressions = []
 
         # Render all frames for each dataset type
         c_frame = 0
@@ -254,28 +494,253 @@ class NerfSyntheticDatasetExporter:
                 self.prepare_frame(frame)
                 image_path = self.export_path / dataset_type / f"r_{frame}.png"
                 
-                # Render the image
-                render_image(image_path)
-
-                # Calculate rotation value
-                rotation_value = 360 / 200 * (math.pi / 180)
+                if self._frames_reusable and image_path.exists():
+                    self.log(f"Keeping existing image: {image_path}")
+                    # Without a render the camera matrix has to be updated explicitly
+                    self.context.view_layer.update()
+                else:
+                    # Render the image
+                    render_image(image_path)
+                    compressions.append(compressor.submit(recompress_png, image_path, self.PNG_COMPRESSION_LEVEL))
 
                 # filepath to save
                 relative_path = f"./{dataset_type}/r_{frame}"
                 # Track camera transform data in the respective dictionary
                 transforms_dicts[dataset_type]["frames"].append({
                     "file_path": relative_path,
-                    "rotation": rotation_value,
+                    "rotation": ROTATION_VALUE,
                     "transform_matrix": self.current_camera_transform_matrix
                 })
                 c_frame += 1
             self.log(f"Finished rendering frames for {dataset_type}")
+
+        compressor.shutdown(wait=True)
+        for compression in compressions:
+            compression.result()  # Raise errors from the background threads
+        self.log("Finished compressing frames")
         
-        # Save the camera transform data to json files
+        self._save_transforms(transforms_dicts)
+        self._write_manifest()
+
+        self.write_log()
+
+    def render_all_multi_gpu(self, gpu_ids, blender_executable="blender"):
+        """
+        Renders all frames like render_all, but splits them across several GPUs.
+        The scene is saved to a copy that one background Blender process per GPU renders
+        its shard of the frames from. The camera transforms of all shards are merged
+        into the same json files render_all writes.
+
+        Parameters:
+        gpu_ids: Indices of the GPUs to render on, starting at 0. They count only the devices of
+                 the selected backend (the first available of COMPUTE_DEVICE_TYPES), in the order
+                 Cycles lists them in Preferences > System. The CPU is not counted.
+        blender_executable: Path to the Blender executable used for the worker processes.
+        """
+        # Validate before anything is configured or the manifest is removed
+        gpu_ids = list(gpu_ids)
+        if not gpu_ids:
+            raise ValueError("gpu_ids must contain at least one GPU index.")
+        if len(set(gpu_ids)) != len(gpu_ids):
+            raise ValueError(f"gpu_ids must not contain duplicate GPU indices: {gpu_ids}")
+
+        self._configure_render()
+        self._invalidate_manifest()
+
+        shard_dir = self.export_path / "shards"
+        os.makedirs(shard_dir, exist_ok=True)
+        blend_path = shard_dir / "scene.blend"
+        self.ops.wm.save_as_mainfile(filepath=str(blend_path), copy=True)
+
+        frames = [
+            (dataset_type, frame)
+            for dataset_type, n_frames in self.dataset_sizes.items()
+            for frame in range(n_frames)
+        ]
+
+        # Start one worker per GPU, each rendering every len(gpu_ids)-th frame
+        workers = []
+        for shard_index, gpu_id in enumerate(gpu_ids):
+            shard = {
+                "gpu_id": gpu_id,
+                "focus_location": list(self._focus_location),
+                "frames_reusable": self._frames_reusable,
+                "png_compression_level": self.PNG_COMPRESSION_LEVEL,
+                "output_path": str(shard_dir / f"shard_{shard_index}_transforms.json"),
+                "frames": [
+                    {
+                        "index": index,
+                        "location": self.camera_positions[frame].tolist(),
+                        "image_path": str(self.export_path / dataset_type / f"r_{frame}.png")
+                    }
+                    for index, (dataset_type, frame) in enumerate(frames)
+                    if index % len(gpu_ids) == shard_index
+                ]
+            }
+            shard_path = shard_dir / f"shard_{shard_index}.json"
+            write_json(shard_path, shard)
+
+            # Workers import this file as a top level module from its own directory. __name__
+            # doesn't work for that when imported from a package or run as __main__
+            module_path = Path(__file__).resolve()
+            script_path = shard_dir / f"shard_{shard_index}.py"
+            with open(script_path, "w") as f:
+                f.write(SHARD_SCRIPT.format(
+                    module_dir=str(module_path.parent),
+                    module_name=module_path.stem,
+                    shard_path=str(shard_path)
+                ))
+
+            self.log(f"Rendering {len(shard['frames'])} frames on GPU {gpu_id}")
+            workers.append(subprocess.Popen([
+                blender_executable, "-b", str(blend_path),
+                "--python-exit-code", "1", "-P", str(script_path)
+            ]))
+
+        failed_gpus = [gpu_id for gpu_id, worker in zip(gpu_ids, workers) if worker.wait() != 0]
+        if failed_gpus:
+            self.write_log()
+            raise RuntimeError(f"Rendering failed on GPU(s) {failed_gpus}, see the Blender output for details.")
+
+        # Merge the camera transforms of all shards back into frame order
+        transform_matrices = {}
+        for shard_index in range(len(gpu_ids)):
+            with open(shard_dir / f"shard_{shard_index}_transforms.json", "r") as f:
+                for entry in json.load(f):
+                    transform_matrices[entry["index"]] = entry["transform_matrix"]
+
+        transforms_dicts = self._empty_transforms_dicts()
+        for index, (dataset_type, frame) in enumerate(frames):
+            transforms_dicts[dataset_type]["frames"].append({
+                "file_path": f"./{dataset_type}/r_{frame}",
+                "rotation": ROTATION_VALUE,
+                "transform_matrix": transform_matrices[index]
+            })
+        self.log(f"Finished rendering frames on GPU(s) {gpu_ids}")
+
+        self._save_transforms(transforms_dicts)
+        self._write_manifest()
+        shutil.rmtree(shard_dir)
+
+        self.write_log()
+
+    def _configure_render(self):
+        """
+        Applies the Cycles and output settings shared by all render methods to the scene and
+        enables the GPU. Only runs once per exporter, so devices are enumerated a single time
+        even when several renders are started.
+        """
+        if self._render_configured:
+            return
+
+        # Set the rendering engine to Cycles
+        self.context.scene.render.engine = 'CYCLES'
+
+        # Only the camera changes between frames, so keep the synced scene data (BVH, shaders)
+        # alive between renders instead of rebuilding it for every frame
+        self.context.scene.render.use_persistent_data = True
+        self.context.scene.cycles.debug_use_spatial_splits = False
+
+        # Larger tiles for GPU rendering. Blender 3.0+ removed tile_x/tile_y and already
+        # renders the whole frame as one tile at this resolution
+        if hasattr(self.context.scene.render, "tile_x"):
+            self.context.scene.render.tile_x = 256
+            self.context.scene.render.tile_y = 256
+
+        # Optional: Configure the number of samples for rendering (affects render quality)
+        self.context.scene.cycles.samples = self.RENDER_SAMPLES  # Adjust sample size
+
+        # Stop sampling pixels once their noise is below the threshold
+        self.context.scene.cycles.use_adaptive_sampling = True
+        self.context.scene.cycles.adaptive_threshold = 0.01
+
+        # Progressive refine only exists before Blender 3.0 and slows down final renders
+        if hasattr(self.context.scene.cycles, "use_progressive_refine"):
+            self.context.scene.cycles.use_progressive_refine = False
+
+        self.context.scene.render.image_settings.file_format = 'PNG'
+        self.context.scene.render.resolution_x = self.RENDER_RESOLUTION[0]
+        self.context.scene.render.resolution_y = self.RENDER_RESOLUTION[1]
+        self.context.scene.render.image_settings.color_mode = 'RGB'
+        self.context.scene.render.image_settings.color_depth = '16'
+        # Frames are compressed afterwards with recompress_png, off the render loop
+        self.context.scene.render.image_settings.compression = 0
+
+        device_type = self._enable_best_gpu()
+
+        # Denoising makes up for the low sample count. Cycles only offers the OptiX denoiser
+        # when OptiX devices are available, OpenImageDenoise runs everywhere else
+        self.context.scene.cycles.use_denoising = True
+        self.context.scene.cycles.denoiser = 'OPENIMAGEDENOISE'
+        if device_type == 'OPTIX':
+            try:
+                self.context.scene.cycles.denoiser = 'OPTIX'
+            except TypeError:
+                # OptiX denoiser not offered by this Blender build, keep OpenImageDenoise
+                pass
+
+        self._render_configured = True
+
+    def _enable_best_gpu(self):
+        """
+        Selects the fastest available GPU backend (see COMPUTE_DEVICE_TYPES) and enables all
+        of its devices. Falls back to the CPU if no GPU is available.
+
+        Returns:
+        The selected device type, or None when rendering on the CPU.
+        """
+        preferences = self.context.preferences.addons['cycles'].preferences
+        device_type = select_compute_device_type(preferences)
+        if device_type is None:
+            self.log("No supported GPU found, rendering on the CPU")
+            self.context.scene.cycles.device = 'CPU'
+            return None
+
+        # Only use the devices of the selected backend
+        for device in preferences.devices:
+            device.use = False
+        for device in get_compute_devices(preferences, device_type):
+            device.use = True
+
+        # Enable GPU rendering for the scene in Cycles settings
+        self.context.scene.cycles.device = 'GPU'
+        self.log(f"Rendering on the GPU using {device_type}")
+        return device_type
+
+    def _invalidate_manifest(self):
+        """
+        Removes the manifest before frames are (re)rendered, so an interrupted run never leaves
+        a manifest behind that vouches for truncated or uncompressed frames.
+        """
+        manifest_path = self.export_path / "manifest.json"
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+    def _write_manifest(self):
+        """
+        Writes the manifest once all frames are rendered and compressed.
+        """
+        write_json(self.export_path / "manifest.json", self.export_manifest())
+
+    def _empty_transforms_dicts(self):
+        """
+        Returns one transforms dictionary per dataset type without any frames.
+        """
+        # The camera intrinsics are the same for every frame
+        camera_angle_x = self.scene.camera.data.angle_x
+        return {
+            dataset_type: {
+                "camera_angle_x": camera_angle_x,
+                "frames": []
+            }
+            for dataset_type in self.dataset_sizes
+        }
+
+    def _save_transforms(self, transforms_dicts):
+        """
+        Saves the camera transform data to one json file per dataset type.
+        """
         for dataset_type, data in transforms_dicts.items():
             file_path = self.export_path / f"transforms_{dataset_type}.json"
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
+            write_json(file_path, data)
             self.log(f"Saved camera transform data to {file_path}")
-
-        self.write_log()
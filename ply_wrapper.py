@@ -1,9 +1,85 @@
+import os
+import functools
 import pandas as pd
 from plyfile import PlyData
 from pathlib import Path
 import numpy as np
 from typing import List
 
+try:
+    import torch
+except ImportError:
+    # torch is only needed for get_data_torch
+    torch = None
+
+
+def _ply_vertex_count(ply_path):
+    # Modification time and size are part of the cache key, so rewritten files are read again
+    stat = os.stat(ply_path)
+    return _cached_ply_vertex_count(os.path.abspath(ply_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_ply_vertex_count(ply_path, mtime_ns, size):
+    # Reads the count of the first element from the PLY header without touching the element data
+    with open(ply_path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith(b"element "):
+                return int(line.split()[2])
+            if line == b"end_header":
+                break
+    raise ValueError(f"No element declared in the header of: {ply_path}")
+
+
+def _bucket_property_names(properties, prefixes):
+    # Sorts the property names into one list per prefix in a single pass,
+    # each list ordered by the index after the last underscore
+    buckets = {prefix: [] for prefix in prefixes}
+    for prop in properties:
+        for prefix in prefixes:
+            if prop.name.startswith(prefix):
+                buckets[prefix].append(prop.name)
+                break
+    for names in buckets.values():
+        names.sort(key=lambda x: int(x.split('_')[-1]))
+    return buckets
+
+
+def _float32_matrix(vertices):
+    # Reinterprets a structured array of packed native float32 fields as an (N, n_fields) matrix
+    # without copying. Returns None for any other layout (e.g. doubles or big endian data).
+    dtype = vertices.dtype
+    if dtype.names is None or dtype.itemsize != 4 * len(dtype.names) or not vertices.flags.c_contiguous:
+        return None
+    if any(dtype.fields[name][0] != np.float32 for name in dtype.names):
+        return None
+    return np.asarray(vertices).view(np.float32).reshape(len(vertices), len(dtype.names))
+
+
+def _stack_fields(vertices, names):
+    # Gathers the named fields of a structured array into a single float32 (N, len(names)) block
+    stacked = np.empty((len(vertices), len(names)), dtype=np.float32)
+    if not names:
+        return stacked
+    return np.stack([vertices[name] for name in names], axis=1, out=stacked)
+
+
+def _gather_fields(vertices, matrix, names):
+    # Returns the named fields as a read-only float32 (N, len(names)) block. Fields stored next to
+    # each other on disk are a strided view into the float32 matrix, other orders are copied from it.
+    # Views share memory with the PlyData, so writing to them would silently change its vertices.
+    if matrix is None:
+        block = _stack_fields(vertices, names)
+    else:
+        columns = [vertices.dtype.names.index(name) for name in names]
+        if columns and columns == list(range(columns[0], columns[0] + len(columns))):
+            block = matrix[:, columns[0]:columns[0] + len(columns)]
+        else:
+            block = matrix[:, columns]
+    block.setflags(write=False)
+    return block
+
 
 class PlyWrapper:
     def __init__(self, data):
@@ -12,35 +88,30 @@ class PlyWrapper:
             ply_path = Path(data)
             if not ply_path.exists():
                 raise FileNotFoundError(f"File not found: {data}")
-            self.ply_data = PlyData.read(data)
+            # Memory-map the element data of binary files instead of parsing it into memory
+            self.ply_data = PlyData.read(ply_path, mmap=True)
         elif isinstance(data, PlyData):
             self.ply_data = data
         else:
             raise ValueError("Either ply_path or ply_data must be provided.")
         
-        self.capture_data()
+        # The attributes (xyz, opacities, ...) are only built on first access
         
     def matching_dimensions(self, other: Path):
         # Check if 'other' is a Path object or string path to the PLY file
         if isinstance(other, (str, Path)):
-            other_ply_data = PlyData.read(other)  # Read from the file path
+            other_count = _ply_vertex_count(other)  # Only the header is read
         elif isinstance(other, PlyData):
-            other_ply_data = other  # Directly use the provided PlyData object
+            other_count = len(other.elements[0])  # Directly use the provided PlyData object
         else:
             raise TypeError("The 'other' parameter must be a file path (str or Path) or a PlyData object.")
         
+        # All properties of an element share the element's vertex count
+        matches = len(self.ply_data.elements[0]) == other_count
         matching_dims = {
-            "xyz": (
-                self.ply_data.elements[0]["x"].count == other_ply_data.elements[0]["x"].count
-                and self.ply_data.elements[0]["y"].count == other_ply_data.elements[0]["y"].count
-                and self.ply_data.elements[0]["z"].count == other_ply_data.elements[0]["z"].count
-            ),
-            "opacities": self.ply_data.elements[0]["opacity"].count == other_ply_data.elements[0]["opacity"].count,
-            "direct_current": (
-                self.ply_data.elements[0]["f_dc_0"].count == other_ply_data.elements[0]["f_dc_0"].count
-                and self.ply_data.elements[0]["f_dc_1"].count == other_ply_data.elements[0]["f_dc_1"].count
-                and self.ply_data.elements[0]["f_dc_2"].count == other_ply_data.elements[0]["f_dc_2"].count
-            ),
+            "xyz": matches,
+            "opacities": matches,
+            "direct_current": matches,
         }
         return matching_dims
     
@@ -52,46 +123,48 @@ class PlyWrapper:
         }
     
     def capture_data(self):
-        self.xyz = np.stack((np.asarray(self.ply_data.elements[0]["x"]),
-                             np.asarray(self.ply_data.elements[0]["y"]),
-                             np.asarray(self.ply_data.elements[0]["z"])),  axis=1)
-        self.opacities = np.asarray(self.ply_data.elements[0]["opacity"])[..., np.newaxis]
-        self.direct_current = np.zeros((self.xyz.shape[0], 3, 1))
-        self.direct_current[:, 0, 0] = np.asarray(self.ply_data.elements[0]["f_dc_0"])
-        self.direct_current[:, 1, 0] = np.asarray(self.ply_data.elements[0]["f_dc_1"])
-        self.direct_current[:, 2, 0] = np.asarray(self.ply_data.elements[0]["f_dc_2"])
-        self.direct_current = self.direct_current.squeeze()
-        
-        extra_f_names = [p.name for p in self.ply_data.elements[0].properties if p.name.startswith("f_rest_")]
-        extra_f_names = sorted(extra_f_names, key=lambda x: int(x.split('_')[-1]))
-        
-        self.higher_order_shs = np.zeros((len(self.xyz), len(extra_f_names)))
-        for i, f_name in enumerate(extra_f_names):
-            self.higher_order_shs[:, i] = np.asarray(self.ply_data.elements[0][f_name])
-        
-        #self.max_sh_degree = int(extra_f_names[-1].split('_')[-1])
-        # assert len(extra_f_names)==3*(self.max_sh_degree + 1) ** 2 - 3
-        #features_extra = np.zeros((self.xyz.shape[0], len(extra_f_names)))
-        #for idx, attr_name in enumerate(extra_f_names):
-        #    features_extra[:, idx] = np.asarray(self.ply_data.elements[0][attr_name])
-        # Reshape (P,F*SH_coeffs) to (P, F, SH_coeffs except DC)
-        #features_extra = features_extra.reshape((features_extra.shape[0], 3, (self.max_sh_degree + 1) ** 2 - 1))
-        #self.higher_order = features_extra
-
-        scale_names = [p.name for p in self.ply_data.elements[0].properties if p.name.startswith("scale_")]
-        scale_names = sorted(scale_names, key = lambda x: int(x.split('_')[-1]))
-        scales = np.zeros((self.xyz.shape[0], len(scale_names)))
-        for idx, attr_name in enumerate(scale_names):
-            scales[:, idx] = np.asarray(self.ply_data.elements[0][attr_name])
-
-        rot_names = [p.name for p in self.ply_data.elements[0].properties if p.name.startswith("rot")]
-        rot_names = sorted(rot_names, key = lambda x: int(x.split('_')[-1]))
-        rots = np.zeros((self.xyz.shape[0], len(rot_names)))
-        for idx, attr_name in enumerate(rot_names):
-            rots[:, idx] = np.asarray(self.ply_data.elements[0][attr_name])
-        
-        self.scaling = scales
-        self.rotation = rots
+        # Builds all attributes at once instead of on first access
+        for attr in ("xyz", "opacities", "direct_current", "higher_order_shs", "scaling", "rotation"):
+            getattr(self, attr)
+
+    @functools.cached_property
+    def _vertices(self):
+        # Structured array of the vertex element, every property is a named field
+        return self.ply_data.elements[0].data
+
+    @functools.cached_property
+    def _vertex_matrix(self):
+        # 3DGS stores every property as float32, the whole vertex block is then one float32 matrix
+        return _float32_matrix(self._vertices)
+
+    @functools.cached_property
+    def _property_names(self):
+        return _bucket_property_names(self.ply_data.elements[0].properties, ("f_rest_", "scale_", "rot"))
+
+    # Everything is kept as float32, the precision 3DGS stores and renders with
+    @functools.cached_property
+    def xyz(self):
+        return _gather_fields(self._vertices, self._vertex_matrix, ["x", "y", "z"])
+
+    @functools.cached_property
+    def opacities(self):
+        return _gather_fields(self._vertices, self._vertex_matrix, ["opacity"])
+
+    @functools.cached_property
+    def direct_current(self):
+        return _gather_fields(self._vertices, self._vertex_matrix, ["f_dc_0", "f_dc_1", "f_dc_2"])
+
+    @functools.cached_property
+    def higher_order_shs(self):
+        return _gather_fields(self._vertices, self._vertex_matrix, self._property_names["f_rest_"])
+
+    @functools.cached_property
+    def scaling(self):
+        return _gather_fields(self._vertices, self._vertex_matrix, self._property_names["scale_"])
+
+    @functools.cached_property
+    def rotation(self):
+        return _gather_fields(self._vertices, self._vertex_matrix, self._property_names["rot"])
 
     def get_data(self, attrs: List[str] = None):
         if not attrs:
@@ -111,22 +184,40 @@ class PlyWrapper:
                 raise AttributeError(f"'{attr}' is not a valid attribute of PlyWrapper.")
         return data
     
+    def get_data_torch(self, attrs: List[str] = None, device="cuda", dtype=None):
+        """
+        Same as get_data, but returns torch tensors on the given device (float32 by default).
+        Uploads to a CUDA device go through pinned host memory without blocking, so the copies
+        of all attributes overlap instead of running one after another.
+        """
+        if torch is None:
+            raise ImportError("get_data_torch requires PyTorch to be installed.")
+        if dtype is None:
+            dtype = torch.float32
+        device = torch.device(device)
+
+        tensors = {}
+        for attr, array in self.get_data(attrs).items():
+            # The attributes are read-only, torch needs its own writable copy
+            tensor = torch.from_numpy(np.array(array, order="C"))
+            if device.type == "cuda":
+                tensor = tensor.pin_memory()
+            tensors[attr] = tensor.to(device, dtype=dtype, non_blocking=True)
+        return tensors
+
     """
     returns a pandas dataframe of shape (N, 3) containing the SH coefficients as values and the xyz coordinates in the
     index
     """
     def get_sh_coeffs_standardized_format(self):
-        # Flatten XYZ coordinates for the index
-        xyz_tuples = [tuple(coord) for coord in self.xyz]
+        # Build the x, y, z index straight from the coordinate columns, without per-point tuples
+        index = pd.MultiIndex.from_arrays([self.xyz[:, 0], self.xyz[:, 1], self.xyz[:, 2]], names=["x", "y", "z"])
         
         # Concatenate SH coefficients (direct current and higher order)
         # Reshape the SH coefficients into a flat format (if needed)
         sh_coeffs = np.concatenate([self.direct_current, self.higher_order_shs], axis=1)
         
         # Create a pandas DataFrame
-        df = pd.DataFrame(sh_coeffs, index=xyz_tuples)
-        
-        # Name the index columns as x, y, z
-        df.index = pd.MultiIndex.from_tuples(df.index, names=["x", "y", "z"])
+        df = pd.DataFrame(sh_coeffs, index=index)
         
         return df